@@ -1,48 +1,91 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+import pyarrow.parquet as pq
 import os
 
+@st.cache_data(ttl=60)
+def list_data_files(folder):
+    # Prefer the Parquet copy of a CSV when the scraper has written one
+    files = [f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f))]
+    parquet = {f for f in files if f.endswith('.parquet')}
+    csvs = [f for f in files if f.endswith('.csv') and os.path.splitext(f)[0] + '.parquet' not in parquet]
+    return sorted(csvs + list(parquet))
+
+def is_parquet(path):
+    return path.endswith('.parquet')
+
+def downcast_numeric(df):
+    # Floats are cast to float32 outright (to_numeric's downcast keeps float64
+    # whenever a value would lose precision, which is most Zillow price columns);
+    # integers go to the narrowest int that holds the data, which is lossless
+    for col in df.columns:
+        if pd.api.types.is_float_dtype(df[col]):
+            float32 = 'float32[pyarrow]' if isinstance(df[col].dtype, pd.ArrowDtype) else 'float32'
+            df[col] = df[col].astype(float32)
+        elif pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+# mtime is part of each cache key so edited files are re-read
+@st.cache_data(show_spinner=False)
+def get_header(path, mtime):
+    if is_parquet(path):
+        return pq.read_schema(path).names
+    return pd.read_csv(path, nrows=0).columns.tolist()
+
+@st.cache_data(show_spinner=False)
+def load_preview(path, mtime):
+    if is_parquet(path):
+        return next(pq.ParquetFile(path).iter_batches(batch_size=5)).to_pandas()
+    return pd.read_csv(path, nrows=5)
+
+@st.cache_data(show_spinner=False)
+def load_cols(path, mtime, cols):
+    # Only parse the columns being plotted
+    cols = list(dict.fromkeys(cols))
+    if is_parquet(path):
+        df = pd.read_parquet(path, columns=cols, dtype_backend='pyarrow')
+    else:
+        df = pd.read_csv(path, usecols=cols, engine='pyarrow', dtype_backend='pyarrow')
+    return downcast_numeric(df)
+
 st.title("Zillow Housing Data")
 folder_path = "zillow_data"
 
 try:
-    files = os.listdir(folder_path)
-    files = [f for f in files if os.path.isfile(os.path.join(folder_path, f)) and f.endswith('.csv')]
+    files = list_data_files(folder_path)
 except Exception as e:
     st.error(f"Error accessing folder: {e}")
     files = []
 
 if files:
-    selected_file = st.selectbox("Select a CSV file", files)
+    selected_file = st.selectbox("Select a data file", files)
     
     if selected_file:
         try: 
             file_path = os.path.join(folder_path, selected_file)
-            df = pd.read_csv(file_path)
+            mtime = os.path.getmtime(file_path)
         
             st.subheader(f"Preview of {selected_file}")
-            st.write(df.head())
+            st.write(load_preview(file_path, mtime))
         
             # Select columns to plot
-            columns = df.columns.tolist()
+            columns = get_header(file_path, mtime)
         
             x_col = st.selectbox("Select X-axis column", columns, key="x_axis")
             y_col = st.selectbox("Select Y-axis column", columns, key="y_axis")
         
             if st.button("Plot Graph"):
-                fig, ax = plt.subplots()
-                ax.plot(df[x_col], df[y_col], marker='o')
-                ax.set_xlabel(x_col)
-                ax.set_ylabel(y_col)
-                ax.set_title(f"{y_col} vs {x_col}")
-                st.pyplot(fig)
+                df = load_cols(file_path, mtime, (x_col, y_col))
+                # Rendered client-side by Vega-Lite, with pan/zoom
+                st.subheader(f"{y_col} vs {x_col}")
+                st.line_chart(data=df, x=x_col, y=y_col)
 
         except Exception as e:
             st.error(f"Error loading or processing file: {e}")
 
 else:
-    st.info(f"No CSV files found in the folder: {folder_path}")
+    st.info(f"No CSV or Parquet files found in the folder: {folder_path}")
 
 
 
@@ -6,39 +6,305 @@ Iterates through all data types and geographies for each section
 
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException, NoSuchElementException
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+import httpx
+import aiofiles
+import pandas as pd
+import asyncio
 import time
 import os
-import random
 import argparse
 import glob
 from pathlib import Path
 import itertools
+import math
+import queue
+import threading
+import json
+import hashlib
+import importlib.util
+import sqlite3
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from email.message import Message
+from urllib.parse import urlparse, unquote
+
+# Returns every data section with its dropdowns and options in one round-trip.
+# Sections are divs holding dropdowns and a download control, falling back to
+# any div with dropdowns; each select carries its index in querySelectorAll('select').
+SECTION_TREE_JS = """
+function getXPath(el) {
+    const parts = [];
+    for (; el && el.nodeType === Node.ELEMENT_NODE; el = el.parentNode) {
+        let i = 1;
+        for (let sib = el.previousElementSibling; sib; sib = sib.previousElementSibling) {
+            if (sib.tagName === el.tagName) i++;
+        }
+        parts.unshift(el.tagName.toLowerCase() + '[' + i + ']');
+    }
+    return '/' + parts.join('/');
+}
+const selectIndex = new Map(Array.from(document.querySelectorAll('select')).map((s, i) => [s, i]));
+const withSelects = Array.from(document.querySelectorAll('div')).filter(d => d.querySelector('select'));
+const hasDownload = d => d.querySelector("button[class*='download'], a[href*='download']") ||
+    Array.from(d.querySelectorAll('button')).some(b => b.textContent.includes('Download'));
+let sections = withSelects.filter(hasDownload);
+if (!sections.length) sections = withSelects;
+return sections.map(d => ({
+    xpath: getXPath(d),
+    selects: Array.from(d.querySelectorAll('select')).map(s => ({
+        index: selectIndex.get(s),
+        options: Array.from(s.options).filter(o => o.value).map(o => ({value: o.value, text: o.text.trim()}))
+    }))
+}));
+"""
+# Download control locators, tried in order; CSS wherever XPath text matching isn't needed
+BUTTON_SELECTORS = [
+    (By.XPATH, ".//button[contains(text(), 'Download')]"),
+    (By.XPATH, ".//a[contains(text(), 'Download')]"),
+    (By.CSS_SELECTOR, "button[class*='download']"),
+    (By.CSS_SELECTOR, "a[class*='download']"),
+    (By.CSS_SELECTOR, "button[data-download]"),
+    (By.CSS_SELECTOR, "a[data-download]"),
+    (By.CSS_SELECTOR, "input[type='submit']"),
+    (By.CSS_SELECTOR, "button[type='submit']")
+]
+# Chrome's in-progress download suffixes
+TEMP_SUFFIXES = ('.crdownload', '.tmp')
+# Direct fetches stream here and are renamed into place only once complete
+PART_SUFFIX = '.part'
+# CDP expression that sets every changed (selectIndex, value) pair, then waits for
+# the section to react: it resolves once its DOM has been quiet for quietMs after
+# a mutation, or after settleMs if nothing changes. Values missing from a select
+# fail immediately. Returns whether every value is still selected.
+SELECT_VALUES_EXPR = """(async ([xpath, pairs, settleMs, quietMs]) => {
+    const selects = document.querySelectorAll('select');
+    for (const [i, value] of pairs) {
+        if (!Array.from(selects[i].options).some(o => o.value === value)) {
+            throw new Error('No option with value ' + JSON.stringify(value));
+        }
+    }
+    const changed = pairs.filter(([i, value]) => selects[i].value !== value);
+    if (changed.length) {
+        const section = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        const root = (section && section.parentElement) || document.body;
+        const settled = new Promise(resolve => {
+            let quiet = null;
+            const observer = new MutationObserver(() => {
+                clearTimeout(quiet);
+                quiet = setTimeout(done, quietMs);
+            });
+            const limit = setTimeout(done, settleMs);
+            function done() {
+                observer.disconnect();
+                clearTimeout(limit);
+                clearTimeout(quiet);
+                resolve();
+            }
+            observer.observe(root, {subtree: true, childList: true, attributes: true, characterData: true});
+        });
+        for (const [i, value] of changed) {
+            selects[i].value = value;
+            selects[i].dispatchEvent(new Event('change', {bubbles: true}));
+        }
+        await settled;
+    }
+    const current = document.querySelectorAll('select');
+    return pairs.every(([i, value]) => current[i] && current[i].value === value);
+})(%s)"""
+# Upper bound on waiting for the page to react to a selection, and the quiet
+# period after its last DOM mutation that counts as settled (milliseconds)
+SELECT_SETTLE_MS = 2000
+SELECT_QUIET_MS = 150
+# Sidecar in the output directory listing URLs fetched by earlier runs
+SEEN_URLS_FILE = ".seen_urls.json"
+# SQLite index in the output directory of combinations already downloaded
+STATE_DB_FILE = ".scraper_state.db"
+# Resolved URLs fetched (and recorded) per batch
+FETCH_BATCH_SIZE = 256
+# Cap on in-flight direct fetches sharing one pooled HTTP/2 client
+MAX_CONCURRENT_FETCHES = 16
+# Write buffer for streamed downloads
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+# Retries for a rate-limited (HTTP 429) direct fetch
+RATE_LIMIT_RETRIES = 3
+# Adaptive backoff: doubles (from at least 1s, at most once per throttling
+# episode) when throttled, decays on success, never exceeds BACKOFF_MAX seconds
+BACKOFF_FLOOR = 1.0
+BACKOFF_MAX = 60.0
+BACKOFF_DECAY = 0.9
+# Challenge pages shown instead of a download when the site throttles us
+CAPTCHA_SELECTOR = "#captcha, #px-captcha"
+# Media and trackers the scraper never needs; blocked via CDP on every browser
+BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.mp4',
+    '*googletagmanager*', '*google-analytics*', '*doubleclick*'
+]
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+def unique_path(path, suffix=''):
+    """Return path, or a 'name (n).ext' variant if it already exists
+
+    The file path + suffix is created exclusively before returning, so
+    concurrent callers are never handed the same name.
+    """
+    stem, ext = os.path.splitext(path)
+    candidate = path
+    n = 1
+    while True:
+        # A name is taken if it exists or a direct fetch is still streaming into it
+        if not os.path.exists(candidate) and not os.path.exists(candidate + PART_SUFFIX):
+            try:
+                os.close(os.open(candidate + suffix, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return candidate
+            except FileExistsError:
+                pass
+        candidate = f"{stem} ({n}){ext}"
+        n += 1
+
+class DownloadEventHandler(FileSystemEventHandler):
+    """Queue each download once Chrome has finished writing it"""
+    def __init__(self, completed):
+        self.completed = completed
+        self._seen = set()
+
+    def _push(self, path):
+        if path.endswith(TEMP_SUFFIXES) or path in self._seen:
+            return
+        self._seen.add(path)
+        self.completed.put(path)
+
+    def on_moved(self, event):
+        # Chrome renames foo.csv.crdownload -> foo.csv when done
+        if not event.is_directory:
+            self._push(event.dest_path)
+
+    def on_closed(self, event):
+        if not event.is_directory:
+            self._push(event.src_path)
+
+class DriverPool:
+    """Fixed set of launched browsers checked out by worker tasks
+
+    Already running slots can be handed in; launch(i) starts the rest in
+    parallel. The pool owns every slot once constructed.
+    """
+    def __init__(self, size, launch, slots=()):
+        self._idle = queue.Queue()
+        self.slots = list(slots)
+        launched, errors = [], []
+        with ThreadPoolExecutor(max_workers=max(size - len(self.slots), 1), thread_name_prefix="launch") as launcher:
+            futures = [launcher.submit(launch, i) for i in range(len(self.slots), size)]
+            for future in futures:
+                try:
+                    launched.append(future.result())
+                except Exception as e:
+                    errors.append(e)
+        if errors:
+            # Don't leak the browsers that did start; handed-in slots stay with the caller
+            self._quit(launched)
+            raise errors[0]
+        self.slots.extend(launched)
+        for slot in self.slots:
+            self._idle.put(slot)
+
+    @contextmanager
+    def acquire(self):
+        slot = self._idle.get()
+        try:
+            yield slot
+        finally:
+            self._idle.put(slot)
+
+    @staticmethod
+    def _quit(slots):
+        for slot in slots:
+            try:
+                slot['driver'].quit()
+            except Exception:
+                pass
+
+    def close(self):
+        self._quit(self.slots)
+        self.slots = []
 
 class ZillowComprehensiveScraper:
-    def __init__(self, headless=True, timeout=30):
-        self.driver = None
+    def __init__(self, headless=True, timeout=30, workers=8):
         self.headless = headless
         self.timeout = timeout
-        self.download_dir = None
+        self.workers = workers
+        self.output_dir = None
         self.downloaded_files = []
+        self.seen_urls = set()
+        # Each thread drives its own browser and download directory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._observers = []
+        self.driver_pool = None
+        self._parquet_pool = None
+        self.state = None
+        # Seconds to wait before each browser action or fetch; 0 until throttled
+        self.backoff = 0.0
+
+    @property
+    def driver(self):
+        return getattr(self._local, 'driver', None)
+
+    @driver.setter
+    def driver(self, value):
+        self._local.driver = value
+
+    @property
+    def download_dir(self):
+        return getattr(self._local, 'download_dir', None)
+
+    @download_dir.setter
+    def download_dir(self, value):
+        self._local.download_dir = value
+
+    @property
+    def completed_downloads(self):
+        return getattr(self._local, 'completed_downloads', None)
 
     def setup_driver(self, download_dir):
         """Initialize Chrome driver with download directory"""
-        self.download_dir = os.path.abspath(download_dir)
-        os.makedirs(self.download_dir, exist_ok=True)
+        slot = self.launch_browser(download_dir)
+        self.bind_slot(slot)
+        return slot
+
+    def bind_slot(self, slot):
+        """Point this thread's driver and download state at a browser slot"""
+        self.driver = slot['driver']
+        self.download_dir = slot['download_dir']
+        self._local.completed_downloads = slot['completed_downloads']
+
+    def launch_browser(self, download_dir, parallel=False):
+        """Start Chrome and a download watcher for one download directory
+
+        Pass parallel=True when other browsers may be launching at the same
+        time; undetected_chromedriver then reuses the already patched
+        chromedriver instead of patching it concurrently.
+        """
+        download_dir = os.path.abspath(download_dir)
+        os.makedirs(download_dir, exist_ok=True)
         
         options = uc.ChromeOptions()
         
         # Set download preferences
         prefs = {
-            "download.default_directory": self.download_dir,
+            "download.default_directory": download_dir,
             "download.prompt_for_download": False,
             "download.directory_upgrade": True,
-            "safebrowsing.enabled": True
+            "safebrowsing.enabled": True,
+            # Skip images and notification prompts
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
         }
         options.add_experimental_option("prefs", prefs)
         
@@ -48,25 +314,39 @@ class ZillowComprehensiveScraper:
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--disable-gpu')
         options.add_argument('--window-size=1920,1080')
-        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        options.add_argument(f'--user-agent={USER_AGENT}')
+        options.add_argument('--blink-settings=imagesEnabled=false')
+
+        # Watch the download directory so completion is event driven
+        completed_downloads = queue.Queue()
+        observer = Observer()
+        observer.schedule(DownloadEventHandler(completed_downloads), download_dir)
+        observer.start()
+        with self._lock:
+            self._observers.append(observer)
 
         print("🔧 Launching Chrome...")
-        self.driver = uc.Chrome(options=options)
-        print(f"✅ Chrome ready, downloads: {self.download_dir}")
+        driver = uc.Chrome(options=options, user_multi_procs=parallel)
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
+        print(f"✅ Chrome ready, downloads: {download_dir}")
+        return {
+            'driver': driver,
+            'download_dir': download_dir,
+            'completed_downloads': completed_downloads,
+            'visited': False
+        }
 
     def wait_for_page_load(self):
         """Wait for page to fully load"""
         try:
-            WebDriverWait(self.driver, self.timeout).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(3)
+            wait = WebDriverWait(self.driver, self.timeout)
+            wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
             
-            # Scroll to ensure all content loads
+            # Scroll to ensure all content loads, then wait for the dropdowns to render
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
             self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait.until(EC.presence_of_all_elements_located((By.TAG_NAME, "select")))
             
             print("✅ Page loaded")
             return True
@@ -75,153 +355,167 @@ class ZillowComprehensiveScraper:
             return False
 
     def find_data_sections(self):
-        """Find all data sections on the page"""
-        section_selectors = [
-            # Common patterns for data sections
-            ".data-section",
-            ".research-section", 
-            ".download-section",
-            "[data-section]",
-            ".dataset",
-            ".data-product",
-            # Look for containers with dropdowns
-            "*:has(select)",
-            # Div containers that might contain dropdowns
-            "div:has(select):has(button)",
-            "section:has(select)",
-            "article:has(select)"
-        ]
-        
+        """Find all data sections on the page
+
+        The whole section/dropdown/option tree comes back from one script
+        call as plain descriptors (an XPath locator, select indices and
+        option values) so worker threads can re-locate sections in their
+        own browser.
+        """
         sections = []
         
-        # Try to find parent containers that have both dropdowns and download buttons
-        potential_sections = self.driver.find_elements(By.XPATH, "//div[.//select and (.//button[contains(@class, 'download')] or .//a[contains(@href, 'download')] or .//button[contains(text(), 'Download')])]")
-        
-        if not potential_sections:
-            # Fallback: find any containers with select elements
-            potential_sections = self.driver.find_elements(By.XPATH, "//div[.//select]")
-        
-        for i, section in enumerate(potential_sections):
-            try:
-                # Find dropdowns within this section
-                selects = section.find_elements(By.TAG_NAME, "select")
-                if selects:
-                    sections.append({
-                        'element': section,
-                        'index': i,
-                        'selects': selects
-                    })
-                    print(f"📊 Found section {i+1} with {len(selects)} dropdown(s)")
-            except Exception as e:
-                print(f"⚠️ Error processing section {i}: {e}")
+        for i, node in enumerate(self.driver.execute_script(SECTION_TREE_JS)):
+            sections.append({
+                'index': i,
+                'locator': node['xpath'],
+                'download_selector': None,
+                'options': [select['options'] for select in node['selects']],
+                'select_indices': [select['index'] for select in node['selects']]
+            })
+            print(f"📊 Found section {i+1} with {len(node['selects'])} dropdown(s)")
         
         print(f"🎯 Found {len(sections)} data sections total")
         return sections
 
-    def get_dropdown_options(self, select_element):
-        """Get all options from a dropdown"""
+    def find_clickable(self, element, selector):
+        """First displayed, enabled match for a locator within an element"""
         try:
-            select = Select(select_element)
-            options = []
-            for option in select.options:
-                if option.get_attribute('value') and option.get_attribute('value') != '':
-                    options.append({
-                        'value': option.get_attribute('value'),
-                        'text': option.text.strip()
-                    })
-            return options
-        except Exception as e:
-            print(f"⚠️ Error getting dropdown options: {e}")
-            return []
+            for button in element.find_elements(*selector):
+                if button.is_displayed() and button.is_enabled():
+                    return button
+        except Exception:
+            pass
+        return None
 
     def find_download_button(self, section):
-        """Find download button within a section"""
-        button_selectors = [
-            ".//button[contains(text(), 'Download')]",
-            ".//a[contains(text(), 'Download')]",
-            ".//button[contains(@class, 'download')]",
-            ".//a[contains(@class, 'download')]",
-            ".//button[@data-download]",
-            ".//a[@data-download]",
-            ".//input[@type='submit']",
-            ".//button[@type='submit']"
-        ]
+        """Find download button within a section
+
+        The locator that wins is remembered on the section descriptor, so
+        later combinations skip straight to it.
+        """
+        descriptor = section['descriptor']
+        cached = descriptor.get('download_selector')
+        if cached:
+            button = self.find_clickable(section['element'], cached)
+            if button:
+                return button
         
-        for selector in button_selectors:
-            try:
-                buttons = section.find_elements(By.XPATH, selector)
-                for button in buttons:
-                    if button.is_displayed() and button.is_enabled():
-                        return button
-            except:
+        for selector in BUTTON_SELECTORS:
+            if selector == cached:
                 continue
+            button = self.find_clickable(section['element'], selector)
+            if button:
+                descriptor['download_selector'] = selector
+                return button
         return None
 
     def select_dropdown_combination(self, section, combination):
         """Select a specific combination of dropdown values"""
         try:
-            selects = section['selects']
+            pairs = [[index, option['value']] for index, option in zip(section['select_indices'], combination)]
+            # One Runtime.evaluate message sets every dropdown and waits for the page to react
+            args = [section['locator'], pairs, SELECT_SETTLE_MS, SELECT_QUIET_MS]
+            result = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+                'expression': SELECT_VALUES_EXPR % json.dumps(args),
+                'awaitPromise': True,
+                'returnByValue': True
+            })
+            if 'exceptionDetails' in result:
+                details = result['exceptionDetails']
+                raise RuntimeError(details.get('exception', {}).get('description') or details.get('text', 'script error'))
             
-            for i, (select_elem, option) in enumerate(zip(selects, combination)):
-                # Scroll to dropdown
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", select_elem)
-                time.sleep(0.5)
-                
-                select = Select(select_elem)
-                select.select_by_value(option['value'])
-                
+            if not result['result'].get('value'):
+                print("❌ Page reset the dropdown values")
+                return False
+            
+            for i, option in enumerate(combination):
                 print(f"   📋 Dropdown {i+1}: {option['text']}")
-                time.sleep(0.5)  # Small delay between selections
             
             return True
         except Exception as e:
             print(f"❌ Error selecting combination: {e}")
             return False
 
+    def discard_stale_downloads(self):
+        """Drop downloads left over from earlier clicks that timed out
+
+        Otherwise a late file would be credited to the next click.
+        """
+        while True:
+            try:
+                stale = self.completed_downloads.get_nowait()
+            except queue.Empty:
+                return
+            print(f"⚠️ Late download, not matched to a combination: {os.path.basename(stale)}")
+
     def wait_for_download(self, timeout=15):
-        """Wait for download to complete"""
-        initial_files = set(glob.glob(os.path.join(self.download_dir, "*")))
-        
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            current_files = set(glob.glob(os.path.join(self.download_dir, "*")))
-            new_files = current_files - initial_files
-            
-            if new_files:
-                # Check if download is complete (no temporary files)
-                temp_files = [f for f in new_files if f.endswith('.crdownload') or f.endswith('.tmp')]
-                if not temp_files:
-                    completed_files = [f for f in new_files if not f.endswith('.crdownload') and not f.endswith('.tmp')]
-                    if completed_files:
-                        print(f"✅ Downloaded: {os.path.basename(completed_files[0])}")
-                        self.downloaded_files.extend(completed_files)
-                        return True
-            
-            time.sleep(1)
+        """Wait for download to complete, returning the finished file's path or None"""
+        try:
+            completed_file = self.completed_downloads.get(timeout=timeout)
+        except queue.Empty:
+            print("⏳ Download timeout - continuing anyway")
+            return None
         
-        print("⏳ Download timeout - continuing anyway")
-        return False
+        print(f"✅ Downloaded: {os.path.basename(completed_file)}")
+        with self._lock:
+            self.downloaded_files.append(completed_file)
+        return completed_file
+
+    def record_success(self):
+        with self._lock:
+            self.backoff = self.backoff * BACKOFF_DECAY if self.backoff > 0.05 else 0.0
+
+    def record_throttle(self, started_with):
+        """Double the backoff, unless another request already raised it past started_with
+
+        Concurrent requests throttled together share one doubling instead of
+        compounding it.
+        """
+        with self._lock:
+            raised = min(BACKOFF_MAX, max(BACKOFF_FLOOR, started_with * 2))
+            if self.backoff > started_with or raised <= self.backoff:
+                return
+            self.backoff = raised
+        print(f"⏳ Throttled, backing off {self.backoff:.1f}s")
+
+    def captcha_visible(self):
+        try:
+            return bool(self.driver.find_elements(By.CSS_SELECTOR, CAPTCHA_SELECTOR))
+        except Exception:
+            return False
 
     def download_combination(self, section, combination, combo_num, total_combos):
-        """Download a specific combination"""
+        """Download a specific combination of a section descriptor
+
+        Returns {'url': ...} when the button links straight to a file, so the
+        caller can fetch it over HTTP; otherwise clicks through Chrome and
+        returns {'path': ...} for the finished download. False on failure.
+        """
         print(f"\n📥 Combination {combo_num}/{total_combos}")
         
         # Select the dropdown combination
         if not self.select_dropdown_combination(section, combination):
             return False
         
+        # Locate the section after selecting, since the page may have re-rendered it
+        section = self.locate_section(section)
+        
         # Find and click download button
-        download_btn = self.find_download_button(section['element'])
+        download_btn = self.find_download_button(section)
         if not download_btn:
             print("❌ No download button found for this section")
             return False
         
         try:
-            # Scroll to download button
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", download_btn)
-            time.sleep(0.5)
+            # Direct links are fetched later without the browser
+            href = download_btn.get_attribute('href')
+            if href and href.startswith('http'):
+                print(f"🔗 Resolved {href}")
+                return {'url': href}
             
-            # Click download button
+            self.discard_stale_downloads()
+            
+            # Click download button (click() scrolls it into view)
             try:
                 download_btn.click()
             except ElementClickInterceptedException:
@@ -229,53 +523,318 @@ class ZillowComprehensiveScraper:
             
             print("🖱️ Download button clicked")
             
-            # Wait for download
-            self.wait_for_download()
-            
-            # Random delay between downloads
-            delay = random.uniform(2, 4)
-            time.sleep(delay)
-            
-            return True
+            # Only a finished download counts, so timeouts are retried next run
+            path = self.wait_for_download()
+            return {'path': path} if path else False
             
         except Exception as e:
             print(f"❌ Error downloading: {e}")
             return False
 
+    def locate_section(self, section):
+        """Re-locate a section descriptor in the current browser"""
+        element = self.driver.find_element(By.XPATH, section['locator'])
+        return dict(section, element=element, descriptor=section)
+
     def process_section(self, section):
-        """Process all combinations for a single section"""
+        """Report a section's dropdown options and return its combination count"""
         print(f"\n🔄 Processing section {section['index'] + 1}")
         
-        # Get all dropdown options
-        all_options = []
-        for i, select_elem in enumerate(section['selects']):
-            options = self.get_dropdown_options(select_elem)
-            all_options.append(options)
+        all_options = section['options']
+        for i, options in enumerate(all_options):
             print(f"   📋 Dropdown {i+1}: {len(options)} options")
         
         if not all_options or not all(all_options):
             print("⚠️ No valid dropdown options found")
             return 0
         
-        # Generate all combinations
-        combinations = list(itertools.product(*all_options))
-        print(f"🔢 Total combinations for this section: {len(combinations)}")
-        
-        successful_downloads = 0
-        
-        # Download each combination
+        total = math.prod(len(options) for options in all_options)
+        print(f"🔢 Total combinations for this section: {total}")
+        return total
+
+    def open_state(self):
+        """Open the on-disk index of completed combinations"""
+        self.state = sqlite3.connect(os.path.join(self.output_dir, STATE_DB_FILE))
+        self.state.execute(
+            "CREATE TABLE IF NOT EXISTS done(key TEXT PRIMARY KEY, path TEXT, completed_at REAL)"
+        )
+        # Direct-link combinations are recorded here as soon as their URL is
+        # known, so an interrupted run never has to resolve them again
+        self.state.execute("CREATE TABLE IF NOT EXISTS resolved(key TEXT PRIMARY KEY, url TEXT)")
+        self.state.execute("CREATE INDEX IF NOT EXISTS resolved_url ON resolved(url)")
+        self.state.commit()
+
+    def combo_key(self, section, combination):
+        """Stable key for a section/combination pair"""
+        payload = {'section': section['locator'], 'combo': [option['value'] for option in combination]}
+        return hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def is_recorded(self, key):
+        """True if a combination is downloaded or already resolved to a URL"""
+        return self.state.execute(
+            "SELECT 1 FROM done WHERE key = ? UNION ALL SELECT 1 FROM resolved WHERE key = ?",
+            (key, key)
+        ).fetchone() is not None
+
+    def record_resolved(self, key, url):
+        with self.state:
+            self.state.execute("INSERT OR IGNORE INTO resolved(key, url) VALUES (?, ?)", (key, url))
+
+    def pending_urls(self):
+        """Distinct resolved URLs whose combinations aren't downloaded yet"""
+        rows = self.state.execute(
+            "SELECT DISTINCT r.url FROM resolved r LEFT JOIN done d ON d.key = r.key WHERE d.key IS NULL"
+        )
+        return [url for (url,) in rows]
+
+    def mark_url_done(self, url, path=None):
+        """Mark every combination that resolved to a URL as downloaded"""
+        with self.state:
+            self.state.execute(
+                "INSERT OR IGNORE INTO done(key, path, completed_at) SELECT key, ?, ? FROM resolved WHERE url = ?",
+                (path, time.time(), url)
+            )
+
+    def recorded_path(self, url):
+        """Where an earlier run saved a URL's file, if it was recorded"""
+        row = self.state.execute(
+            "SELECT d.path FROM resolved r JOIN done d ON d.key = r.key WHERE r.url = ? AND d.path IS NOT NULL LIMIT 1",
+            (url,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def move_recorded_path(self, old_path, new_path):
+        with self.state:
+            self.state.execute("UPDATE done SET path = ? WHERE path = ?", (new_path, old_path))
+
+    def mark_done(self, key, path=None):
+        with self.state:
+            self.state.execute(
+                "INSERT OR IGNORE INTO done(key, path, completed_at) VALUES (?, ?, ?)",
+                (key, path, time.time())
+            )
+
+    def iter_combinations(self, section, total):
+        """Lazily yield work items for every combination of a section not yet downloaded"""
+        combinations = itertools.product(*section['options'])
         for combo_num, combination in enumerate(combinations, 1):
-            combo_description = " × ".join([opt['text'] for opt in combination])
-            print(f"🎯 {combo_description}")
+            if self.is_recorded(self.combo_key(section, combination)):
+                continue
+            yield section, combination, combo_num, total
+
+    def iter_results(self, pool, items, url):
+        """Submit work items as workers free up, yielding (item, result) as they finish
+
+        Only a small window of futures is in flight, so the combination
+        stream is never materialized.
+        """
+        pending = {}
+        for item in items:
+            pending[pool.submit(self.download_task, url, *item)] = item
+            if len(pending) >= self.workers * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+        for future in as_completed(pending):
+            yield pending[future], future.result()
+
+    def launch_worker(self, worker_num):
+        """Launch a pooled browser with its own download directory"""
+        return self.launch_browser(os.path.join(self.output_dir, f"worker_{worker_num}"), parallel=True)
+
+    def download_task(self, url, section, combination, combo_num, total_combos):
+        """Worker entry point: download one combination in a pooled browser"""
+        with self.driver_pool.acquire() as slot:
+            self.bind_slot(slot)
+            backoff = self.backoff
+            if backoff:
+                time.sleep(backoff)
+            
+            result = False
+            try:
+                # Each browser starts clean and loads the research page only once
+                if not slot['visited']:
+                    self.driver.delete_all_cookies()
+                    self.driver.get(url)
+                    if self.wait_for_page_load():
+                        slot['visited'] = True
+                    # Otherwise leave the slot unvisited so the next task retries the navigation
+                
+                if slot['visited']:
+                    combo_description = " × ".join([opt['text'] for opt in combination])
+                    print(f"🎯 {combo_description}")
+                    result = self.download_combination(section, combination, combo_num, total_combos)
+            except Exception as e:
+                print(f"❌ Worker error: {e}")
             
-            if self.download_combination(section, combination, combo_num, len(combinations)):
-                successful_downloads += 1
+            # Any failure may be a challenge page, however far the combination got
+            if result:
+                self.record_success()
+            elif self.captcha_visible():
+                self.record_throttle(backoff)
+            return result
+
+    def collect_worker_files(self):
+        """Move files from per-worker directories into the shared output directory
+
+        Call only once the pooled browsers have quit, so no download is
+        still being written. Partial downloads left behind are deleted.
+        """
+        collected = []
+        for worker_dir in glob.glob(os.path.join(self.output_dir, "worker_*")):
+            for path in glob.glob(os.path.join(worker_dir, "*")):
+                if path.endswith(TEMP_SUFFIXES):
+                    os.remove(path)
+                    continue
+                target = unique_path(os.path.join(self.output_dir, os.path.basename(path)))
+                os.replace(path, target)
+                self.move_recorded_path(path, target)
+                collected.append(target)
+                self.schedule_parquet(target)
+            try:
+                os.rmdir(worker_dir)
+            except OSError:
+                pass
         
-        return successful_downloads
+        self.downloaded_files = collected
+        return collected
+
+    def convert_to_parquet(self, path):
+        """Write a Snappy-compressed Parquet copy next to a downloaded CSV
+
+        The copy only appears under its final name once fully written, since
+        the dashboard prefers a .parquet over its CSV.
+        """
+        parquet_path = os.path.splitext(path)[0] + '.parquet'
+        part_path = parquet_path + PART_SUFFIX
+        try:
+            pd.read_csv(path).to_parquet(part_path, engine='pyarrow', compression='snappy')
+            os.replace(part_path, parquet_path)
+            print(f"🗜️ Converted: {os.path.basename(parquet_path)}")
+        except Exception as e:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            print(f"⚠️ Error converting {os.path.basename(path)} to Parquet: {e}")
+
+    def schedule_parquet(self, path):
+        """Convert a CSV in the background so downloads aren't held up"""
+        if path.endswith('.csv'):
+            self._parquet_pool.submit(self.convert_to_parquet, path)
+
+    def filename_for(self, url, response):
+        """Pick a file name from Content-Disposition, falling back to the URL path"""
+        disposition = response.headers.get('content-disposition')
+        if disposition:
+            message = Message()
+            message['content-disposition'] = disposition
+            filename = message.get_filename()
+            if filename:
+                return os.path.basename(filename)
+        return os.path.basename(unquote(urlparse(url).path)) or "download.csv"
+
+    async def fetch_one(self, client, url):
+        """Stream a single URL to the output directory, returning the saved path"""
+        try:
+            for attempt in range(RATE_LIMIT_RETRIES + 1):
+                backoff = self.backoff
+                if backoff:
+                    await asyncio.sleep(backoff)
+                async with client.stream("GET", url) as response:
+                    # Only back off when the server actually rate-limits us
+                    if response.status_code == 429 and attempt < RATE_LIMIT_RETRIES:
+                        self.record_throttle(backoff)
+                        continue
+                    response.raise_for_status()
+                    # Reserve the .part name before awaiting so concurrent fetches can't collide
+                    path = unique_path(os.path.join(self.output_dir, self.filename_for(url, response)), PART_SUFFIX)
+                    part_path = path + PART_SUFFIX
+                    try:
+                        # Writes run off the event loop so other streams keep flowing
+                        async with aiofiles.open(part_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                            async for chunk in response.aiter_bytes(chunk_size=1 << 20):
+                                await f.write(chunk)
+                        os.replace(part_path, path)
+                    except BaseException:
+                        # Never leave a truncated file behind
+                        if os.path.exists(part_path):
+                            os.remove(part_path)
+                        raise
+                    print(f"✅ Downloaded: {os.path.basename(path)}")
+                    self.downloaded_files.append(path)
+                    self.schedule_parquet(path)
+                    self.record_success()
+                    return path
+        except Exception as e:
+            # One failed URL must not cancel the rest of the batch
+            print(f"❌ Error fetching {url}: {e}")
+            return None
+
+    async def fetch_csv_direct(self, urls, cookies):
+        """Fetch resolved download URLs concurrently in batches, returning how many succeeded
+
+        Each batch is recorded in the index and .seen_urls.json as soon as
+        it finishes, so an interruption loses at most one batch.
+        """
+        jar = httpx.Cookies()
+        for cookie in cookies:
+            jar.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+        
+        async with httpx.AsyncClient(
+            http2=True,
+            cookies=jar,
+            headers={'User-Agent': USER_AGENT},
+            limits=httpx.Limits(max_connections=MAX_CONCURRENT_FETCHES),
+            timeout=self.timeout,
+            follow_redirects=True,
+        ) as client:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+            
+            async def bounded_fetch(url):
+                async with semaphore:
+                    return await self.fetch_one(client, url)
+            
+            fetched = 0
+            for start in range(0, len(urls), FETCH_BATCH_SIZE):
+                batch = urls[start:start + FETCH_BATCH_SIZE]
+                results = await asyncio.gather(*(bounded_fetch(url) for url in batch))
+                for url, path in zip(batch, results):
+                    if path:
+                        self.mark_url_done(url, path)
+                        self.seen_urls.add(url)
+                        fetched += 1
+                self.save_seen_urls()
+        return fetched
+
+    def load_seen_urls(self):
+        """Load URLs fetched by previous runs so they aren't downloaded again"""
+        path = os.path.join(self.output_dir, SEEN_URLS_FILE)
+        try:
+            with open(path) as f:
+                self.seen_urls = set(json.load(f))
+        except (OSError, ValueError):
+            self.seen_urls = set()
+        if self.seen_urls:
+            print(f"📒 {len(self.seen_urls)} URLs already downloaded by earlier runs")
+
+    def save_seen_urls(self):
+        """Persist fetched URLs next to the downloads"""
+        path = os.path.join(self.output_dir, SEEN_URLS_FILE)
+        with open(path, 'w') as f:
+            json.dump(sorted(self.seen_urls), f, indent=2)
 
     def run(self, url, output_dir="downloads"):
         """Main scraping process"""
-        self.setup_driver(output_dir)
+        # httpx only needs h2 once http2=True is used; fail before launching Chrome
+        if importlib.util.find_spec("h2") is None:
+            print('❌ HTTP/2 support is missing - install it with: pip install "httpx[http2]"')
+            return
+        
+        self.output_dir = os.path.abspath(output_dir)
+        # The discovery browser becomes the pool's first worker afterwards
+        discovery = self.setup_driver(os.path.join(self.output_dir, "worker_0"))
+        self.load_seen_urls()
+        self.open_state()
+        self._parquet_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="parquet")
         
         try:
             print(f"🌐 Navigating to {url}")
@@ -283,6 +842,7 @@ class ZillowComprehensiveScraper:
             
             if not self.wait_for_page_load():
                 return
+            discovery['visited'] = True
             
             # Find all data sections
             sections = self.find_data_sections()
@@ -290,29 +850,77 @@ class ZillowComprehensiveScraper:
                 print("❌ No data sections found")
                 return
             
+            # Stream every section's combinations as one flat work list
+            totals = [(section, self.process_section(section)) for section in sections]
+            work = itertools.chain.from_iterable(
+                self.iter_combinations(section, total) for section, total in totals if total
+            )
+            
+            print(f"\n🚀 Downloading {sum(total for _, total in totals)} combinations with {self.workers} workers")
             total_downloads = 0
             
-            # Process each section
-            for section in sections:
-                downloads = self.process_section(section)
-                total_downloads += downloads
-                
-                # Longer delay between sections
-                if section != sections[-1]:  # Not the last section
-                    delay = random.uniform(5, 10)
-                    print(f"⏳ Waiting {delay:.1f}s before next section...")
-                    time.sleep(delay)
+            print(f"🔧 Starting {self.workers - 1} more pooled browsers")
+            self.driver_pool = DriverPool(self.workers, self.launch_worker, [discovery])
+            
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="worker") as pool:
+                for (section, combination, _, _), result in self.iter_results(pool, work, url):
+                    key = self.combo_key(section, combination)
+                    if not result:
+                        continue
+                    if 'url' in result:
+                        # Already-fetched URLs are marked done with their path below
+                        self.record_resolved(key, result['url'])
+                    else:
+                        total_downloads += 1
+                        # Updated to the final location when worker files are collected
+                        self.mark_done(key, result['path'])
+            
+            # Quit the pooled browsers first so no download is mid-write while collecting
+            cookies = self.driver.get_cookies()
+            self.driver_pool.close()
+            self.driver_pool = None
+            self.driver = None
+            print("🔌 Browsers closed")
+            self.collect_worker_files()
+            
+            # Many combinations resolve to the same file; this also picks up
+            # URLs resolved by an earlier run that was interrupted
+            direct_urls = []
+            for pending_url in self.pending_urls():
+                if pending_url in self.seen_urls:
+                    self.mark_url_done(pending_url, self.recorded_path(pending_url))
+                else:
+                    direct_urls.append(pending_url)
+            
+            if direct_urls:
+                print(f"\n⚡ Fetching {len(direct_urls)} unique files directly over HTTP")
+                total_downloads += asyncio.run(self.fetch_csv_direct(direct_urls, cookies))
             
             print(f"\n🎉 Scraping complete!")
             print(f"✅ Total successful downloads: {total_downloads}")
-            print(f"📁 Files saved to: {self.download_dir}")
+            print(f"📁 Files saved to: {self.output_dir}")
             print(f"📊 Downloaded files: {len(self.downloaded_files)}")
             
         except Exception as e:
             print(f"❌ Error during scraping: {e}")
         finally:
+            # Let pending Parquet conversions finish
+            self._parquet_pool.shutdown(wait=True)
+            if self.state:
+                self.state.close()
+                self.state = None
+            for observer in self._observers:
+                observer.stop()
+                observer.join()
+            self._observers = []
+            if self.driver_pool:
+                # Includes the discovery browser
+                self.driver_pool.close()
+                self.driver_pool = None
+                self.driver = None
             if self.driver:
                 self.driver.quit()
+                self.driver = None
                 print("🔌 Browser closed")
 
 if __name__ == "__main__":
@@ -323,6 +931,8 @@ if __name__ == "__main__":
                        help="Directory to save all CSV files")
     parser.add_argument("--headless", action="store_true", 
                        help="Run browser in headless mode")
+    parser.add_argument("--workers", type=int, default=8, 
+                       help="Number of parallel browser workers")
     args = parser.parse_args()
 
     print("🏠 Zillow Comprehensive CSV Scraper")
@@ -330,7 +940,8 @@ if __name__ == "__main__":
     print(f"🎯 Target: {args.url}")
     print(f"📁 Output: {args.output_dir}")
     print(f"👻 Headless: {args.headless}")
+    print(f"🧵 Workers: {args.workers}")
     print("=" * 60)
 
-    scraper = ZillowComprehensiveScraper(headless=args.headless)
+    scraper = ZillowComprehensiveScraper(headless=args.headless, workers=args.workers)
     scraper.run(args.url, args.output_dir)
\ No newline at end of file